@@ -1,32 +1,47 @@
 # app/middleware/correlation.py
-import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import secrets
 import logging
 
 logger = logging.getLogger(__name__)
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    """Middleware pour ajouter un ID de corrélation à chaque requête"""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Récupère ou génère un request_id
-        request_id = request.headers.get('X-Request-ID', str(uuid.uuid4()))
-        
-        # Ajoute le request_id à l'état de la requête
-        request.state.request_id = request_id
-        
-        # Log de début de requête
-        logger.info(f"Requête {request_id} - {request.method} {request.url.path}")
-        
-        # Traitement de la requête
-        response = await call_next(request)
-        
-        # Ajoute le request_id dans les headers de réponse
-        response.headers['X-Request-ID'] = request_id
-        
-        # Log de fin de requête
-        logger.info(f"Réponse {request_id} - Statut {response.status_code}")
-        
-        return response
-    
\ No newline at end of file
+class CorrelationMiddleware:
+    """Middleware ASGI pour ajouter un ID de corrélation à chaque requête"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Récupère ou génère un request_id : parcours unique des headers bruts
+        # (noms de headers ASGI en minuscules), sans objet Headers intermédiaire
+        request_id_raw = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id_raw = value
+                break
+        if request_id_raw is None:
+            request_id_raw = secrets.token_hex(16).encode("ascii")
+
+        # Ajoute le request_id à l'état de la requête (request.state)
+        request_id = request_id_raw.decode("latin-1")
+        scope.setdefault("state", {})["request_id"] = request_id
+        # Les octets bruts sont renvoyés tels quels dans le header de réponse
+        request_id_header = (b"x-request-id", request_id_raw)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                # Ajoute le request_id dans les headers de réponse
+                message["headers"] = list(message.get("headers", ())) + [request_id_header]
+
+                # Un seul log par requête, formaté uniquement si INFO est actif
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Requête %s - %s %s - Statut %s",
+                        request_id, scope["method"], scope["path"], message["status"],
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
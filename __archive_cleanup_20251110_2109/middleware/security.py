@@ -1,25 +1,31 @@
 # app/middleware/security.py
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware pour les headers de sécurité HTTP"""
-    
-    async def dispatch(self, request, call_next):
-        response = await call_next(request)
-        
-        # Headers de sécurité modernes (2025)
-        security_headers = {
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            # X-XSS-Protection retiré car obsolète - CSP est la protection moderne
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Permissions-Policy": "geolocation=(), microphone=(), camera=()"
-        }
-        
-        for header, value in security_headers.items():
-            response.headers[header] = value
-            
-        return response
-    
\ No newline at end of file
+# Headers de sécurité modernes (2025), encodés une seule fois à l'import
+# X-XSS-Protection retiré car obsolète - CSP est la protection moderne
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+)
+
+class SecurityHeadersMiddleware:
+    """Middleware ASGI pour les headers de sécurité HTTP"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message):
+            if message["type"] == "http.response.start":
+                # Nouvelle liste : celle du message appartient à l'application
+                # (ex. Response.raw_headers) et peut être réutilisée
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
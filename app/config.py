@@ -1,39 +1,46 @@
 # app/config.py - Version définitive
 import os
-from typing import Dict, Any
+import logging
+import functools
+from dataclasses import dataclass, field
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration pour OLIVIA"""
+    """Configuration pour OLIVIA (lue une seule fois, voir get_config)"""
     
-    def __init__(self):
-        # Configuration de base
-        self.HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", "15"))
-        
-        # Mode démo par défaut
-        self.MODE_DEMO = True
-        
-        # Identifiants de démonstration
-        self.JUDILIBRE_TOKEN_URL = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
-        self.JUDILIBRE_CLIENT_ID = "demo_client_id"
-        self.JUDILIBRE_CLIENT_SECRET = "demo_client_secret"
-        self.JUDILIBRE_API_BASE = "https://sandbox-api.piste.gouv.fr/cassation/judilibre/v1.0"
-        
-        self.LEGIFRANCE_TOKEN_URL = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
-        self.LEGIFRANCE_CLIENT_ID = "demo_client_id"
-        self.LEGIFRANCE_CLIENT_SECRET = "demo_client_secret"
-        self.LEGIFRANCE_API_BASE = "https://sandbox-api.piste.gouv.fr/dila/legifrance/lf-engine-app"
-        
-        self.JUSTICE_BACK_TOKEN_URL = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
-        self.JUSTICE_BACK_CLIENT_ID = "demo_client_id"
-        self.JUSTICE_BACK_CLIENT_SECRET = "demo_client_secret"
-        self.JUSTICE_BACK_API_BASE = "https://sandbox-api.piste.gouv.fr/minju/v1/Justiceback"
-        
-        # Feature flags
-        self.FF_JUDILIBRE = True
-        self.FF_LEGIFRANCE = True  
-        self.FF_JUSTICEBACK = True
+    # Configuration de base
+    HTTP_TIMEOUT: int = field(default_factory=lambda: int(os.getenv("HTTP_TIMEOUT", "15")))
+    
+    # Mode démo par défaut
+    MODE_DEMO: bool = True
+    
+    # Identifiants de démonstration
+    JUDILIBRE_TOKEN_URL: str = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
+    JUDILIBRE_CLIENT_ID: str = "demo_client_id"
+    JUDILIBRE_CLIENT_SECRET: str = "demo_client_secret"
+    JUDILIBRE_API_BASE: str = "https://sandbox-api.piste.gouv.fr/cassation/judilibre/v1.0"
+    
+    LEGIFRANCE_TOKEN_URL: str = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
+    LEGIFRANCE_CLIENT_ID: str = "demo_client_id"
+    LEGIFRANCE_CLIENT_SECRET: str = "demo_client_secret"
+    LEGIFRANCE_API_BASE: str = "https://sandbox-api.piste.gouv.fr/dila/legifrance/lf-engine-app"
+    
+    JUSTICE_BACK_TOKEN_URL: str = "https://sandbox-oauth.piste.gouv.fr/api/oauth/token"
+    JUSTICE_BACK_CLIENT_ID: str = "demo_client_id"
+    JUSTICE_BACK_CLIENT_SECRET: str = "demo_client_secret"
+    JUSTICE_BACK_API_BASE: str = "https://sandbox-api.piste.gouv.fr/minju/v1/Justiceback"
+    
+    # Feature flags
+    FF_JUDILIBRE: bool = True
+    FF_LEGIFRANCE: bool = True
+    FF_JUSTICEBACK: bool = True
+
+@functools.cache
+def get_config() -> Config:
+    """Retourne la configuration, construite au premier appel uniquement"""
+    return Config()
 
 # Instance globale
-CFG = Config()
+CFG = get_config()
 
-print("✅ Configuration OLIVIA chargée (Mode Démo)")
\ No newline at end of file
+logging.getLogger(__name__).info("Configuration OLIVIA chargée (Mode Démo)")
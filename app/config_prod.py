@@ -1,26 +1,41 @@
 ﻿# app/config_prod.py - Configuration PRODUCTION PISTE
 import os
+import functools
+from dataclasses import dataclass, field
+from typing import Optional
 
+def _envbool(name: str, default: bool) -> bool:
+    """Lit un booléen ("true"/"false") depuis l'environnement"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() == "true"
+
+@dataclass(frozen=True, slots=True)
 class ConfigProduction:
-    """Configuration PISTE production"""
+    """Configuration PISTE production (lue une seule fois, voir get_config_prod)"""
+    
+    # URLs PRODUCTION PISTE
+    LEGIFRANCE_API_BASE: str = "https://api.piste.gouv.fr/dila/legifrance/lf-engine-app"
+    JUDILIBRE_API_BASE: str = "https://api.piste.gouv.fr/cassation/judilibre/v1.0"
+    JUSTICE_BACK_API_BASE: str = "https://api.piste.gouv.fr/minju/v1/Justiceback"
+    
+    # Tokens production (à définir dans les variables d'environnement)
+    LEGIFRANCE_CLIENT_ID: Optional[str] = field(default_factory=lambda: os.getenv("LEGIFRANCE_CLIENT_ID_PROD"))
+    LEGIFRANCE_CLIENT_SECRET: Optional[str] = field(default_factory=lambda: os.getenv("LEGIFRANCE_CLIENT_SECRET_PROD"))
     
-    def __init__(self):
-        # URLs PRODUCTION PISTE
-        self.LEGIFRANCE_API_BASE = "https://api.piste.gouv.fr/dila/legifrance/lf-engine-app"
-        self.JUDILIBRE_API_BASE = "https://api.piste.gouv.fr/cassation/judilibre/v1.0"
-        self.JUSTICE_BACK_API_BASE = "https://api.piste.gouv.fr/minju/v1/Justiceback"
-        
-        # Tokens production (à définir dans les variables d'environnement)
-        self.LEGIFRANCE_CLIENT_ID = os.getenv("LEGIFRANCE_CLIENT_ID_PROD")
-        self.LEGIFRANCE_CLIENT_SECRET = os.getenv("LEGIFRANCE_CLIENT_SECRET_PROD")
-        
-        # Configuration optimisée production
-        self.HTTP_TIMEOUT = 30
-        self.MODE_DEMO = os.getenv("MODE_DEMO", "false").lower() == "true"
-        self.USER_AGENT = "OLIVIA-PROD/3.0 (Recherche Juridique Professionnelle)"
-        
-        # Quotas et limitations
-        self.MAX_REQUESTS_PER_MINUTE = 60
-        self.CACHE_TTL = 600  # 10 minutes en production
+    # Configuration optimisée production
+    HTTP_TIMEOUT: int = 30
+    MODE_DEMO: bool = field(default_factory=lambda: _envbool("MODE_DEMO", False))
+    USER_AGENT: str = "OLIVIA-PROD/3.0 (Recherche Juridique Professionnelle)"
+    
+    # Quotas et limitations
+    MAX_REQUESTS_PER_MINUTE: int = 60
+    CACHE_TTL: int = 600  # 10 minutes en production
+
+@functools.cache
+def get_config_prod() -> ConfigProduction:
+    """Retourne la configuration production, construite au premier appel uniquement"""
+    return ConfigProduction()
 
-CFG_PROD = ConfigProduction()
+CFG_PROD = get_config_prod()
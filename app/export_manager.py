@@ -1,92 +1,162 @@
 # app/export_manager.py
 import json
-from typing import Dict, List, Any, Optional
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import os
+import threading
 
 try:
-    import pdfkit
-    PDFKIT_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PDFKIT_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
-try:
-    from jinja2 import Template
-    JINJA_AVAILABLE = True  
-except ImportError:
-    JINJA_AVAILABLE = False
+# Nombre de fichiers mémorisés par format (éviction LRU)
+_EXPORT_CACHE_MAX = 64
+
+# Gabarit HTML du rapport PDF (compilé au premier besoin, une seule fois)
+_PDF_TEMPLATE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Rapport OLIVIA</title>
+    <style>
+        body { font-family: Arial; margin: 40px; text-rendering: optimizeSpeed; font-kerning: none; }
+        .header { text-align: center; border-bottom: 2px solid #1E3A8A; padding-bottom: 20px; }
+        .section { margin: 30px 0; }
+        .texte-item { border-left: 4px solid #10B981; padding: 15px; margin: 10px 0; background: #f8fafc; }
+        .metadata { color: #6B7280; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>⚡ RAPPORT OLIVIA ULTIMATE</h1>
+        <p>Généré le {{timestamp}}</p>
+    </div>
+    
+    <div class="section">
+        <h3>🎯 Situation Analysée</h3>
+        <p><strong>{{situation}}</strong></p>
+    </div>
+    
+    {% if textes %}
+    <div class="section">
+        <h3>📚 Textes Législatifs</h3>
+        {% for texte in textes %}
+        <div class="texte-item">
+            <h4>{{texte.title}}</h4>
+            <p class="metadata">{{texte.code}} • {{texte.date}}</p>
+            <p>{{texte.content}}</p>
+        </div>
+        {% endfor %}
+    </div>
+    {% endif %}
+</body>
+</html>
+"""
+
+def _horodatage() -> Tuple[datetime, str]:
+    """Instant de l'export et suffixe de nom de fichier associé (une seule lecture d'horloge)"""
+    maintenant = datetime.now()
+    return maintenant, maintenant.strftime('%Y%m%d_%H%M%S')
 
 class ExportManager:
     """Gestionnaire d'export compatible Cloud"""
     
     def __init__(self):
         self.pdf_config = None
-        if PDFKIT_AVAILABLE:
+        # pdfkit/jinja2 ne sont importés qu'au premier besoin (voir _charger_pdf)
+        self._pdf_charge = False
+        self._pdf_lock = threading.Lock()
+        self._pdfkit = None
+        self._pdf_template = None
+        # Fichiers déjà générés, indexés par empreinte du contenu exporté
+        self._pdf_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._md_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Instance partagée par les sessions Streamlit (threads) : accès aux caches sérialisés
+        self._cache_lock = threading.Lock()
+    
+    def _charger_pdf(self) -> None:
+        """Importe pdfkit/jinja2 et compile le gabarit, une seule fois"""
+        if self._pdf_charge:
+            return
+        with self._pdf_lock:
+            # Une autre session a pu terminer le chargement pendant l'attente du verrou
+            if self._pdf_charge:
+                return
             try:
+                import pdfkit
+                from jinja2 import Environment
                 # Configuration pour environnement avec wkhtmltopdf
-                self.pdf_config = pdfkit.configuration(wkhtmltopdf='/usr/bin/wkhtmltopdf')
-            except:
-                self.pdf_config = None
+                pdf_config = pdfkit.configuration(wkhtmltopdf='/usr/bin/wkhtmltopdf')
+            except (ImportError, IOError, OSError):
+                pdf_config = None
+            
+            if pdf_config is not None:
+                self.pdf_config = pdf_config
+                self._pdfkit = pdfkit
+                # Environnement et gabarit compilés une fois, réutilisés à chaque rapport
+                self._pdf_template = Environment(autoescape=True).from_string(_PDF_TEMPLATE_HTML)
+            # Positionné en dernier : les autres threads ne lisent jamais un état partiel
+            self._pdf_charge = True
     
     def is_pdf_available(self) -> bool:
         """Vérifie si la génération PDF est disponible"""
-        return PDFKIT_AVAILABLE and JINJA_AVAILABLE and self.pdf_config is not None
+        self._charger_pdf()
+        return self._pdf_template is not None and self.pdf_config is not None
+    
+    @staticmethod
+    def _empreinte(data: Dict[str, Any]) -> str:
+        """Empreinte stable du contenu à exporter (clé des caches)"""
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        else:
+            payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _lire_cache(self, cache: "OrderedDict[str, str]", cle: str) -> Optional[str]:
+        """Retourne le fichier mémorisé s'il existe encore sur le disque"""
+        with self._cache_lock:
+            path = cache.get(cle)
+            if path is None:
+                return None
+            if not os.path.exists(path):
+                del cache[cle]
+                return None
+            cache.move_to_end(cle)
+            return path
+    
+    def _ecrire_cache(self, cache: "OrderedDict[str, str]", cle: str, path: str) -> None:
+        with self._cache_lock:
+            cache[cle] = path
+            cache.move_to_end(cle)
+            if len(cache) > _EXPORT_CACHE_MAX:
+                cache.popitem(last=False)
     
     def generer_rapport_pdf(self, data: Dict[str, Any]) -> str:
         """Génère un rapport PDF si disponible, sinon fallback JSON"""
         if not self.is_pdf_available():
             return self.generer_export_json(data)
         
+        cle = self._empreinte(data)
+        pdf_path = self._lire_cache(self._pdf_cache, cle)
+        if pdf_path is not None:
+            return pdf_path
+        
         try:
-            template_html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <title>Rapport OLIVIA</title>
-                <style>
-                    body { font-family: Arial; margin: 40px; }
-                    .header { text-align: center; border-bottom: 2px solid #1E3A8A; padding-bottom: 20px; }
-                    .section { margin: 30px 0; }
-                    .texte-item { border-left: 4px solid #10B981; padding: 15px; margin: 10px 0; background: #f8fafc; }
-                    .metadata { color: #6B7280; font-size: 0.9em; }
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>⚡ RAPPORT OLIVIA ULTIMATE</h1>
-                    <p>Généré le {{timestamp}}</p>
-                </div>
-                
-                <div class="section">
-                    <h3>🎯 Situation Analysée</h3>
-                    <p><strong>{{situation}}</strong></p>
-                </div>
-                
-                {% if textes %}
-                <div class="section">
-                    <h3>📚 Textes Législatifs</h3>
-                    {% for texte in textes %}
-                    <div class="texte-item">
-                        <h4>{{texte.title}}</h4>
-                        <p class="metadata">{{texte.code}} • {{texte.date}}</p>
-                        <p>{{texte.content}}</p>
-                    </div>
-                    {% endfor %}
-                </div>
-                {% endif %}
-            </body>
-            </html>
-            """
-            
-            template = Template(template_html)
-            html_content = template.render(
+            maintenant, suffixe = _horodatage()
+            html_content = self._pdf_template.render(
                 situation=data["situation"],
-                timestamp=datetime.now().strftime("%d/%m/%Y à %H:%M"),
+                timestamp=maintenant.strftime("%d/%m/%Y à %H:%M"),
                 textes=data.get("textes", [])
             )
             
-            pdf_path = f"rapport_olivia_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            # L'empreinte dans le nom évite qu'un autre contenu exporté
+            # dans la même seconde écrase le fichier mémorisé
+            pdf_path = f"rapport_olivia_{suffixe}_{cle[:12]}.pdf"
             
             options = {
                 'page-size': 'A4',
@@ -95,9 +165,14 @@ class ExportManager:
                 'margin-bottom': '0.75in',
                 'margin-left': '0.75in',
                 'encoding': "UTF-8",
+                # Le gabarit est autonome : ni JavaScript, ni image, ni ressource externe
+                'disable-javascript': None,
+                'no-images': None,
+                'load-error-handling': 'ignore',
             }
             
-            pdfkit.from_string(html_content, pdf_path, options=options, configuration=self.pdf_config)
+            self._pdfkit.from_string(html_content, pdf_path, options=options, configuration=self.pdf_config)
+            self._ecrire_cache(self._pdf_cache, cle, pdf_path)
             return pdf_path
             
         except Exception as e:
@@ -106,11 +181,12 @@ class ExportManager:
     
     def generer_export_json(self, data: Dict[str, Any]) -> str:
         """Génère un export JSON structuré"""
+        maintenant, suffixe = _horodatage()
         export_data = {
             "metadata": {
                 "application": "OLIVIA ULTIMATE",
                 "version": "3.0", 
-                "date_generation": datetime.now().isoformat(),
+                "date_generation": maintenant.isoformat(),
                 "sources": ["Légifrance", "Judilibre"]
             },
             "analyse": {
@@ -124,24 +200,36 @@ class ExportManager:
             }
         }
         
-        json_path = f"export_olivia_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        json_path = f"export_olivia_{suffixe}.json"
+        if ORJSON_AVAILABLE:
+            # Sérialisation native (UTF-8 direct), même rendu indenté que json.dump
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
         
         return json_path
     
     def generer_export_markdown(self, data: Dict[str, Any]) -> str:
         """Génère un export Markdown"""
-        markdown_content = f"""# 📋 Rapport OLIVIA
+        cle = self._empreinte(data)
+        md_path = self._lire_cache(self._md_cache, cle)
+        if md_path is not None:
+            return md_path
+        
+        maintenant, suffixe = _horodatage()
+        # Fragments accumulés dans une liste puis joints une seule fois (pas de += quadratique)
+        parts = [f"""# 📋 Rapport OLIVIA
 
 **Situation:** {data['situation']}  
-**Date:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Date:** {maintenant.strftime('%d/%m/%Y %H:%M')}
 
 ## 📚 Textes Législatifs
-"""
+"""]
         
         for texte in data.get("legifrance", {}).get("results", []):
-            markdown_content += f"""
+            parts.append(f"""
 ### {texte.get('title', 'Titre non disponible')}
 
 *{texte.get('code', 'N/A')} • {texte.get('date', 'N/A')}*
@@ -149,12 +237,12 @@ class ExportManager:
 {texte.get('content', 'Contenu non disponible')}
 
 ---
-"""
+""")
         
-        markdown_content += "\n## ⚖️ Jurisprudence\n"
+        parts.append("\n## ⚖️ Jurisprudence\n")
         
         for juri in data.get("judilibre", {}).get("results", []):
-            markdown_content += f"""
+            parts.append(f"""
 ### {juri.get('jurisdiction', 'Juridiction non précisée')}
 
 *Décision du {juri.get('decision_date', 'N/A')}*
@@ -163,12 +251,14 @@ class ExportManager:
 
 {juri.get('summary', 'Non disponible')}
 
-"""
+""")
         
-        md_path = f"rapport_olivia_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        markdown_content = "".join(parts)
+        md_path = f"rapport_olivia_{suffixe}_{cle[:12]}.md"
         with open(md_path, 'w', encoding='utf-8') as f:
             f.write(markdown_content)
         
+        self._ecrire_cache(self._md_cache, cle, md_path)
         return md_path
 
 # Instance globale
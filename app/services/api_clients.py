@@ -23,8 +23,49 @@ LEGIFRANCE = "legifrance"
 JUDILIBRE = "judilibre"
 JUSTICE_BACK = "justice_back"
 
+# Mots-clés déclenchant les résultats de démonstration
+MOTS_CLES_LEGIFRANCE = ("piéton", "accident", "responsabilité")
+MOTS_CLES_JUDILIBRE = ("piéton", "indemnisation", "responsabilité")
+
 print("✅ Types sources définis directement")
 
+# Données de démonstration, construites une seule fois à l'import
+_DEMO_DATA: Dict[str, Tuple[Dict[str, str], ...]] = {
+    "legifrance": (
+        {
+            "id": "LEGI-ART-0000321952",
+            "title": "Article R412-37 du code de la route",
+            "content": "Tout conducteur est tenu de céder le passage au piéton...",
+            "date": "2023-12-12"
+        },
+        {
+            "id": "LEGI-TEXT-0000456712", 
+            "title": "Loi protection des piétons",
+            "content": "Renforcement des sanctions...",
+            "date": "2024-01-01"
+        }
+    ),
+    "judilibre": (
+        {
+            "id": "JURI-PARIS-2023-0456",
+            "jurisdiction": "Cour d'appel de Paris",
+            "decision_date": "2023-11-15",
+            "solution": "Indemnisation majorée",
+            "summary": "Reconnaissance du préjudice d'anxiété...",
+        },
+    ),
+    "justice_back": (
+        {
+            "id": "TJ-PARIS-001",
+            "name": "Tribunal Judiciaire de Paris",
+            "type": "tribunal",
+            "address": "4 Boulevard du Palais, 75001 Paris",
+            "contact": "01 44 32 52 52",
+            "ville": "Paris"
+        },
+    )
+}
+
 class APIClients:
     """Client pour les APIs juridiques PISTE"""
     
@@ -34,65 +75,40 @@ class APIClients:
         self._demo_data = self._charger_demo_data()
         print(f"🎯 APIClients initialisé - Mode: {'DÉMO' if self.config.MODE_DEMO else 'PRODUCTION'}")
     
-    def _charger_demo_data(self) -> Dict[str, Any]:
-        """Charge les données de démonstration"""
-        return {
-            "legifrance": [
-                {
-                    "id": "LEGI-ART-0000321952",
-                    "title": "Article R412-37 du code de la route",
-                    "content": "Tout conducteur est tenu de céder le passage au piéton...",
-                    "date": "2023-12-12"
-                },
-                {
-                    "id": "LEGI-TEXT-0000456712", 
-                    "title": "Loi protection des piétons",
-                    "content": "Renforcement des sanctions...",
-                    "date": "2024-01-01"
-                }
-            ],
-            "judilibre": [
-                {
-                    "id": "JURI-PARIS-2023-0456",
-                    "jurisdiction": "Cour d'appel de Paris",
-                    "decision_date": "2023-11-15",
-                    "solution": "Indemnisation majorée",
-                    "summary": "Reconnaissance du préjudice d'anxiété...",
-                }
-            ],
-            "justice_back": [
-                {
-                    "id": "TJ-PARIS-001",
-                    "name": "Tribunal Judiciaire de Paris",
-                    "type": "tribunal",
-                    "address": "4 Boulevard du Palais, 75001 Paris",
-                    "contact": "01 44 32 52 52",
-                    "ville": "Paris"
-                }
-            ]
-        }
+    def _charger_demo_data(self) -> Dict[str, Tuple[Dict[str, str], ...]]:
+        """Charge les données de démonstration (partagées, ne pas modifier)"""
+        return _DEMO_DATA
+    
+    @staticmethod
+    def _copier(items) -> List[Dict[str, str]]:
+        """Copies des fiches démo : un appelant ne peut pas altérer les données partagées"""
+        return [dict(item) for item in items]
     
     def search_legifrance_advanced(self, query: str, date_from: Optional[date] = None, date_to: Optional[date] = None) -> Tuple[bool, Any]:
         """Recherche Légifrance - mode démo"""
         print(f"🔍 Légifrance: '{query}'")
-        results = [item for item in self._demo_data["legifrance"] 
-                  if any(mot in query.lower() for mot in ["piéton", "accident", "responsabilité"])]
-        return True, {"results": results[:3]}
+        # La pertinence ne dépend que de la requête : un seul passage sur le texte
+        query_lower = query.lower()
+        pertinent = any(mot in query_lower for mot in MOTS_CLES_LEGIFRANCE)
+        results = self._copier(self._demo_data["legifrance"][:3]) if pertinent else []
+        return True, {"results": results}
     
     def search_judilibre_advanced(self, query: str, date_from: Optional[date] = None, jurisdiction: Optional[str] = None) -> Tuple[bool, Any]:
         """Recherche Judilibre - mode démo"""
         print(f"⚖️ Judilibre: '{query}'")
-        results = [item for item in self._demo_data["judilibre"] 
-                  if any(mot in query.lower() for mot in ["piéton", "indemnisation", "responsabilité"])]
-        return True, {"results": results[:2]}
+        query_lower = query.lower()
+        pertinent = any(mot in query_lower for mot in MOTS_CLES_JUDILIBRE)
+        results = self._copier(self._demo_data["judilibre"][:2]) if pertinent else []
+        return True, {"results": results}
     
     def search_justice_back_lieux(self, ville: Optional[str] = None, type_lieu: Optional[str] = None) -> Tuple[bool, Any]:
         """Recherche Justice Back - mode démo"""
         print(f"🏛️ Justice Back: '{ville}'")
         results = self._demo_data["justice_back"]
         if ville:
-            results = [item for item in results if ville.lower() in item.get("ville", "").lower()]
-        return True, {"results": results}
+            ville_lower = ville.lower()
+            results = [item for item in results if ville_lower in item.get("ville", "").lower()]
+        return True, {"results": self._copier(results)}
     
     def compute_hash(self, data: Any) -> str:
         """Calcule un hash pour détecter les changements"""
@@ -10,8 +10,10 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 import requests
 
@@ -22,6 +24,9 @@ except ImportError as exc:  # pragma: no cover - executed only in unusual envs.
 
 LOGGER = logging.getLogger(__name__)
 
+#: Seconds subtracted from ``expires_in`` so a cached token is never used at the edge of its lifetime.
+TOKEN_EXPIRY_MARGIN = 30
+
 
 @dataclass(frozen=True)
 class ServiceSettings:
@@ -53,19 +58,30 @@ class PisteOAuthClient:
     def __init__(self, *, timeout: Optional[int] = None, session: Optional[requests.Session] = None) -> None:
         self._timeout = timeout or getattr(CFG, "HTTP_TIMEOUT", 15)
         self._session = session or requests.Session()
+        # (access_token, token_type, expiry_monotonic) par (token_url, client_id, scope)
+        self._token_cache: Dict[Tuple[str, str, Optional[str]], Tuple[str, Optional[str], float]] = {}
 
-    def fetch_token(self, settings: ServiceSettings) -> Mapping[str, object]:
+    def fetch_token(self, settings: ServiceSettings, *, force_refresh: bool = False) -> Mapping[str, object]:
         """Request a token for ``settings``.
 
+        Tokens are cached per ``(token_url, client_id, scope)`` until
+        :data:`TOKEN_EXPIRY_MARGIN` seconds before the ``expires_in`` announced
+        by the server, so repeated calls on the same client do not hit the
+        OAuth endpoint.  A cache hit returns a new mapping whose ``expires_in``
+        is the number of seconds actually remaining.
+
         Parameters
         ----------
         settings:
             Service definition containing the OAuth credentials.
+        force_refresh:
+            Ignore any cached token and always query the OAuth server.
 
         Returns
         -------
         Mapping[str, object]
-            The JSON payload returned by the OAuth server.
+            The JSON payload returned by the OAuth server, or a payload rebuilt
+            from the cache.
         """
 
         if not settings.token_url:
@@ -75,6 +91,15 @@ class PisteOAuthClient:
                 "Identifiants OAuth manquants. Vérifiez les variables d'environnement ou la configuration."
             )
 
+        cache_key = (settings.token_url, settings.client_id, settings.scope)
+        if not force_refresh:
+            cached = self._token_cache.get(cache_key)
+            if cached is not None:
+                access_token, token_type, expiry = cached
+                remaining = expiry - time.monotonic()
+                if remaining > TOKEN_EXPIRY_MARGIN:
+                    return {"access_token": access_token, "token_type": token_type, "expires_in": int(remaining)}
+
         payload: MutableMapping[str, str] = {"grant_type": "client_credentials"}
         if settings.scope:
             payload["scope"] = settings.scope
@@ -94,10 +119,32 @@ class PisteOAuthClient:
             raise PisteOAuthError(self._format_error(settings.name, response))
 
         try:
-            return response.json()
+            token = response.json()
         except ValueError as exc:  # pragma: no cover - defensive branch.
             raise PisteOAuthError("Réponse OAuth invalide (JSON introuvable).") from exc
 
+        self._remember_token(cache_key, token)
+        return token
+
+    def _remember_token(self, cache_key: Tuple[str, str, Optional[str]], token: Mapping[str, object]) -> None:
+        """Cache the access token and its expiry deadline, if the server announced one."""
+
+        access_token = token.get("access_token")
+        if not access_token:
+            return
+        try:
+            expires_in = float(token.get("expires_in"))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return
+        if expires_in <= TOKEN_EXPIRY_MARGIN:
+            return
+        token_type = token.get("token_type")
+        self._token_cache[cache_key] = (
+            str(access_token),
+            None if token_type is None else str(token_type),
+            time.monotonic() + expires_in,
+        )
+
     @staticmethod
     def _format_error(service_name: str, response: requests.Response) -> str:
         """Generate a readable error message for failed requests."""
@@ -195,12 +242,19 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(f"- {service.name}: client_id={service.obfuscated_client_id()}")
         return 0
 
-    client = PisteOAuthClient()
     results: Dict[str, Mapping[str, object]] = {}
 
-    for service in chosen_services:
+    # Services are queried concurrently; results are reported in the requested order.
+    # Each worker gets its own client: requests.Session is not documented as thread-safe.
+    with ThreadPoolExecutor(max_workers=len(chosen_services)) as executor:
+        futures = [
+            (service, executor.submit(PisteOAuthClient().fetch_token, service))
+            for service in chosen_services
+        ]
+
+    for service, future in futures:
         try:
-            payload = client.fetch_token(service)
+            payload = future.result()
         except PisteOAuthError as exc:
             print(f"[{service.name}] ❌ {exc}")
             continue
@@ -3,6 +3,7 @@ import streamlit as st
 import sys
 import os
 from datetime import datetime
+from html import escape
 
 # Configuration de base
 st.set_page_config(
@@ -101,53 +102,52 @@ if st.button("🔍 Lancer la Recherche", type="primary"):
 # Affichage résultats
 if "resultats" in st.session_state:
     resultats = st.session_state.resultats
+    textes = resultats["legifrance"].get("results", [])
+    jurisprudences = resultats["judilibre"].get("results", [])
     
     # Métriques
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Textes trouvés", len(resultats["legifrance"].get("results", [])))
+        st.metric("Textes trouvés", len(textes))
     with col2:
-        st.metric("Jurisprudence", len(resultats["judilibre"].get("results", [])))
+        st.metric("Jurisprudence", len(jurisprudences))
     with col3:
         st.metric("Stratégie", resultats["analyse"].get("strategie_detectee", "N/A"))
     
     # Résultats Légifrance
     st.header("📚 Textes Législatifs")
-    textes = resultats["legifrance"].get("results", [])
     
     if textes:
-        for i, texte in enumerate(textes[:5]):  # Limite à 5 résultats
-            with st.expander(f"📄 {texte.get('title', 'Sans titre')}"):
-                st.write(f"**Code:** {texte.get('code', 'N/A')}")
-                st.write(f"**Date:** {texte.get('date', 'N/A')}")
-                st.write(f"**Contenu:** {texte.get('content', 'Non disponible')}")
-                
-                # Métadonnées
-                col_meta1, col_meta2 = st.columns(2)
-                with col_meta1:
-                    st.caption(f"ID: {texte.get('id', 'N/A')}")
-                with col_meta2:
-                    st.caption(f"Nature: {texte.get('nature', 'N/A')}")
+        # Un seul bloc HTML (<details> repliables) au lieu d'un st.expander par texte
+        parts = []
+        for texte in textes[:5]:  # Limite à 5 résultats
+            parts.append(
+                f"<details><summary>📄 {escape(str(texte.get('title', 'Sans titre')))}</summary>"
+                f"<b>Code:</b> {escape(str(texte.get('code', 'N/A')))}<br>"
+                f"<b>Date:</b> {escape(str(texte.get('date', 'N/A')))}<br>"
+                f"<b>Contenu:</b> {escape(str(texte.get('content', 'Non disponible')))}<br>"
+                f"<small>ID: {escape(str(texte.get('id', 'N/A')))} • "
+                f"Nature: {escape(str(texte.get('nature', 'N/A')))}</small></details>"
+            )
+        st.markdown("".join(parts), unsafe_allow_html=True)
     else:
         st.info("Aucun texte législatif trouvé")
     
     # Résultats Judilibre
     st.header("⚖️ Jurisprudence")
-    jurisprudences = resultats["judilibre"].get("results", [])
     
     if jurisprudences:
-        for i, juri in enumerate(jurisprudences[:5]):  # Limite à 5 résultats
-            with st.expander(f"⚖️ {juri.get('jurisdiction', 'Juridiction non précisée')}"):
-                st.write(f"**Solution:** {juri.get('solution', 'Non précisée')}")
-                st.write(f"**Date:** {juri.get('decision_date', 'N/A')}")
-                st.write(f"**Résumé:** {juri.get('summary', 'Non disponible')}")
-                
-                # Métadonnées
-                col_juri1, col_juri2 = st.columns(2)
-                with col_juri1:
-                    st.caption(f"N°: {juri.get('number', 'N/A')}")
-                with col_juri2:
-                    st.caption(f"ECLI: {juri.get('ecli', 'N/A')}")
+        parts = []
+        for juri in jurisprudences[:5]:  # Limite à 5 résultats
+            parts.append(
+                f"<details><summary>⚖️ {escape(str(juri.get('jurisdiction', 'Juridiction non précisée')))}</summary>"
+                f"<b>Solution:</b> {escape(str(juri.get('solution', 'Non précisée')))}<br>"
+                f"<b>Date:</b> {escape(str(juri.get('decision_date', 'N/A')))}<br>"
+                f"<b>Résumé:</b> {escape(str(juri.get('summary', 'Non disponible')))}<br>"
+                f"<small>N°: {escape(str(juri.get('number', 'N/A')))} • "
+                f"ECLI: {escape(str(juri.get('ecli', 'N/A')))}</small></details>"
+            )
+        st.markdown("".join(parts), unsafe_allow_html=True)
     else:
         st.info("Aucune jurisprudence trouvée")
     